@@ -1,22 +1,58 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.lines import Line2D
 import os
 import argparse
+import hashlib
+import tempfile
+import glob
+import time
 
-def read_data_file(file_path):
+# Формат подписей оси X для дат
+DATE_FORMAT = '%Y-%m-%d'
+
+# Время жизни файлов parquet-кэша, в секундах (неделя)
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+def read_excel_file(file_path, **kwargs):
     """
-    Чтение данных из файла CSV или Excel без заголовков.
+    Чтение Excel файла самым быстрым из доступных движков.
+    
+    Сначала используется calamine (парсер на Rust, пакет python-calamine),
+    при его отсутствии - движок pandas по умолчанию.
     
     Parameters
     ----------
     file_path : str
-        Путь к файлу с данными. Поддерживаются форматы .csv, .xlsx, .xls
+        Путь к файлу .xlsx или .xls
+    **kwargs
+        Параметры, передаваемые в pandas.read_excel
         
     Returns
     -------
     pandas.DataFrame
-        DataFrame с данными из файла без заголовка столбцов
+        Данные из файла
+    """
+    try:
+        return pd.read_excel(file_path, engine='calamine', **kwargs)
+    except ImportError:
+        return pd.read_excel(file_path, **kwargs)
+
+def read_data_header(file_path):
+    """
+    Чтение первой строки файла с метками осей и заголовком графика.
+    
+    Parameters
+    ----------
+    file_path : str
+        Путь к файлу с данными. Поддерживаются форматы .csv, .xlsx, .xls
+        
+    Returns
+    -------
+    tuple
+        (x_label, y_label, title) - метки осей и заголовок
         
     Raises
     ------
@@ -24,102 +60,252 @@ def read_data_file(file_path):
         Если формат файла не поддерживается
         
     """
-    
-    #Определяем расширения файла,в дальнейшем используем подходящую библиотечную функию
     file_extension = os.path.splitext(file_path)[1]
     
+    # Читаем только первую строку, остальной файл не разбирается
     if file_extension == '.csv':
-        return pd.read_csv(file_path, header=None)
+        header = pd.read_csv(file_path, header=None, nrows=1)
     elif file_extension in ['.xlsx', '.xls']:
-        return pd.read_excel(file_path, header=None)
+        header = read_excel_file(file_path, header=None, nrows=1)
     else:
-         #В случае, если файл имеет иное расширение, вызов исключения
-         raise ValueError(f"Unsupported file format: {file_extension}")
+        #В случае, если файл имеет иное расширение, вызов исключения
+        raise ValueError(f"Unsupported file format: {file_extension}")
+    
+    # Берем строку меток один раз, без повторных обращений через индексатор
+    x_label, y_label, title = header.to_numpy()[0, :3]
+    
+    return (x_label, y_label, title)
 
-def safe_convert_to_float(value):
+def get_cache_path(file_path, data_type):
     """
-    Безопасное преобразование значения в float с заменой запятых на точки.
+    Путь к parquet-кэшу прочитанных данных файла.
+    
+    Ключ кэша включает абсолютный путь, время изменения файла и тип данных
+    (от него зависят параметры чтения), поэтому после редактирования файла
+    кэш автоматически перестает использоваться.
     
     Parameters
     ----------
-    value : any
-        Значение для преобразования
+    file_path : str
+        Путь к файлу с данными
+    data_type : str
+        Тип данных для оси X, с которым читается файл
         
     Returns
     -------
-    float
-        Преобразованное числовое значение
+    str
+        Путь к файлу кэша во временном каталоге
+    """
+    path_hash = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+    mtime = os.path.getmtime(file_path)
+    return os.path.join(tempfile.gettempdir(), f"lpm_{path_hash}_{mtime}_{data_type}.parquet")
+
+def remove_stale_cache(file_path):
+    """
+    Удаление устаревших файлов кэша.
+    
+    Удаляются кэши старше CACHE_MAX_AGE секунд, а также кэши этого же файла,
+    сохраненные до его последнего изменения.
+    
+    Parameters
+    ----------
+    file_path : str
+        Путь к файлу с данными
+    """
+    path_hash = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+    current_prefix = f"lpm_{path_hash}_{os.path.getmtime(file_path)}_"
+    expire_time = time.time() - CACHE_MAX_AGE
+    
+    for cache_path in glob.glob(os.path.join(tempfile.gettempdir(), 'lpm_*.parquet')):
+        cache_name = os.path.basename(cache_path)
+        try:
+            outdated = (cache_name.startswith(f"lpm_{path_hash}_")
+                        and not cache_name.startswith(current_prefix))
+            if outdated or os.path.getmtime(cache_path) < expire_time:
+                os.remove(cache_path)
+        except OSError:
+            # Файл мог удалить параллельно запущенный процесс
+            pass
+
+def write_cache(pd_data, cache_path):
+    """
+    Сохранение данных в parquet-кэш.
+    
+    Данные пишутся во временный файл, который затем атомарно переименовывается,
+    поэтому прерванная запись не оставляет поврежденного кэша. Кэш необязателен:
+    без pyarrow или при смешанных типах в столбце он просто не сохраняется.
+    
+    Parameters
+    ----------
+    pd_data : pandas.DataFrame
+        Прочитанные данные
+    cache_path : str
+        Путь к файлу кэша
     """
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(cache_path), prefix='lpm_', suffix='.tmp'
+    )
+    os.close(file_descriptor)
+    
     try:
-        if isinstance(value, str):
-            value = value.replace(',', '.')
-        return float(value)
-    except (ValueError, TypeError):
-        raise ValueError(f"Не удалось преобразовать значение в число: {value}")
+        pd_data.to_parquet(temp_path)
+        os.replace(temp_path, cache_path)
+    except (ImportError, ValueError, TypeError, OSError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
-def parse_data_types(pd_data, data_type):
+def read_data_file(file_path, data_type='base'):
+    """
+    Чтение данных из файла CSV или Excel.
+    
+    Первая строка файла содержит метки: x_label, y_label, title. Она читается
+    отдельно, а данные разбираются за один проход с пропуском этой строки.
+    Десятичная запятая распознается прямо при чтении, третий столбец не читается.
+    
+    Прочитанные данные кэшируются в формате parquet (если установлен pyarrow),
+    повторный запуск для того же файла читает кэш вместо разбора исходника.
+    
+    Parameters
+    ----------
+    file_path : str
+        Путь к файлу с данными. Поддерживаются форматы .csv, .xlsx, .xls
+    data_type : str, optional
+        Тип данных для оси X: 'date' для дат, иначе числовой. Для числовых
+        CSV парсер pyarrow сразу читает оба столбца как float64
+        
+    Returns
+    -------
+    tuple
+        (pd_data, x_label, y_label, title) - DataFrame со столбцами x_label и
+        y_label, метки осей и заголовок
+        
+    Raises
+    ------
+    ValueError
+        Если формат файла не поддерживается
+        
     """
-    Парсинг и преобразование типов данных из сырого DataFrame.
     
-    Ожидает, что первая строка содержит метки: x_label, y_label, title.
-    Остальные строки содержат данные для построения графика.
+    # Метки читаем отдельно, заодно проверяется расширение файла
+    x_label, y_label, title = read_data_header(file_path)
+    
+    # Parquet читается во много раз быстрее разбора CSV или Excel.
+    # Нечитаемый кэш удаляем и разбираем исходный файл заново
+    cache_path = get_cache_path(file_path, data_type)
+    if os.path.exists(cache_path):
+        try:
+            return (pd.read_parquet(cache_path), x_label, y_label, title)
+        except (ImportError, ValueError, OSError):
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+    
+    #Определяем расширения файла,в дальнейшем используем подходящую библиотечную функию
+    file_extension = os.path.splitext(file_path)[1]
+    
+    # Читаем только первые два столбца, третий пропускается парсером
+    read_options = {'header': None, 'skiprows': 1, 'usecols': [0, 1], 'decimal': ','}
+    
+    if file_extension == '.csv':
+        # Для числовых данных тип известен заранее, pyarrow не тратит время на его
+        # определение. Стандартному движку тип не задаем: значения с десятичной
+        # точкой он оставляет строками, и их преобразует parse_data_types
+        pyarrow_options = dict(read_options)
+        if data_type != 'date':
+            pyarrow_options['dtype'] = 'float64'
+        else:
+            # pyarrow сам распознает даты ISO 8601 и тогда --date-format был бы
+            # проигнорирован, поэтому даты оставляем строками для parse_data_types
+            pyarrow_options['dtype'] = {0: 'string'}
+        
+        # Многопоточный парсер pyarrow заметно быстрее на больших файлах.
+        # При его отсутствии или если его более строгий разбор отверг файл
+        # (например, разное число столбцов в строках), используем стандартный движок
+        try:
+            pd_data = pd.read_csv(file_path, engine='pyarrow', **pyarrow_options)
+        except (ImportError, ValueError):
+            pd_data = pd.read_csv(file_path, **read_options)
+    else:
+        pd_data = read_excel_file(file_path, **read_options)
+    
+    pd_data.columns = [x_label, y_label]
+    
+    remove_stale_cache(file_path)
+    write_cache(pd_data, cache_path)
+    
+    return (pd_data, x_label, y_label, title)
+
+def parse_data_types(pd_data, x_label, y_label, data_type, date_format=None):
+    """
+    Преобразование типов данных, прочитанных read_data_file.
     
     Parameters
     ----------
     pd_data : pandas.DataFrame
-        Сырые данные из файла (первая строка - метаданные)
+        Данные из файла со столбцами x_label и y_label
+    x_label : str
+        Метка для оси X
+    y_label : str
+        Метка для оси Y
     data_type : str
         Тип данных для оси X: 'date' для дат, 'num' для числовых данных
+    date_format : str, optional
+        Формат дат для оси X (например, '%d.%m.%Y'). По умолчанию ожидается ISO 8601
         
     Returns
     -------
-    tuple
-        (pd_data_clean, x_label, y_label, title) - очищенные данные и метки
+    pandas.DataFrame
+        Тот же DataFrame с преобразованными столбцами. Столбцы заменяются
+        на месте, копия данных не создается
         
     Raises
     ------
     ValueError
         Если не удается преобразовать типы данных
-           Examples
-    --------
-    >>> demo_data = create_demo_data()
-    >>> print(demo_data.head())
-       time  temperature
-    0     1           15
-    1     2           16
-    2     3           18
+        
     Examples
     --------
-    >>> raw_data = pd.DataFrame([['Date', 'Temperature', 'График температуры'],
-    ...                         ['2023-01-01', '20,5', ''],
-    ...                         ['2023-01-02', '22,3', '']])
-    >>> clean_data, x_label, y_label, title = parse_data_types(raw_data, 'date')
+    >>> raw_data = pd.DataFrame({'Date': ['2023-01-01', '2023-01-02'],
+    ...                          'Temperature': ['20,5', '22,3']})
+    >>> clean_data = parse_data_types(raw_data, 'Date', 'Temperature', 'date')
     """
-    # Извлекаем название графика и осей
-    x_label = pd_data.iloc[0, 0]
-    y_label = pd_data.iloc[0, 1]
-    title = pd_data.iloc[0, 2]
-    
-    # Удаляем первую строку, где находились данные графика
-    pd_data_clean = pd_data.drop(0)
-    
-    # Удаляем третий столбец если существует
-    if len(pd_data_clean.columns) > 2:
-        pd_data_clean = pd_data_clean.drop(pd_data_clean.columns[2], axis=1)
-    
-    # Переименовываем столбцы
-    pd_data_clean.columns = [x_label, y_label]
-    
     # Преобразуем типы данных
     if data_type == 'date':
-        pd_data_clean[x_label] = pd.to_datetime(pd_data_clean[x_label])
+        x_values = pd_data[x_label]
+        # Убираем пробелы вокруг строковых дат, чтобы они соответствовали формату
+        if pd.api.types.infer_dtype(x_values, skipna=True) == 'string':
+            x_values = x_values.str.strip()
+        # Явный формат позволяет pandas разбирать даты векторно, без dateutil,
+        # а кэш разбирает повторяющиеся даты только один раз
+        pd_data[x_label] = pd.to_datetime(
+            x_values,
+            format=date_format or 'ISO8601',
+            cache=True
+        )
+        # Строковые даты больше не нужны, освобождаем их до обработки оси Y
+        del x_values
     else:
-        pd_data_clean[x_label] = pd.to_numeric(pd_data_clean[x_label])
+        pd_data[x_label] = pd.to_numeric(pd_data[x_label])
     
-    # Обрабатываем значения с запятыми с проверкой
-    pd_data_clean[y_label] = pd_data_clean[y_label].apply(safe_convert_to_float)
+    # Десятичная запятая обычно разобрана при чтении, строковое преобразование
+    # остается для значений, которые не удалось распознать как числа
+    if pd.api.types.is_numeric_dtype(pd_data[y_label]):
+        pd_data[y_label] = pd_data[y_label].astype(float)
+    else:
+        y_values = pd_data[y_label]
+        # Смешанные столбцы (например, числа и текст из Excel) приводим к строкам,
+        # столбцы из одних строк используем как есть
+        if pd.api.types.infer_dtype(y_values, skipna=True) != 'string':
+            y_values = y_values.astype(str)
+        pd_data[y_label] = pd.to_numeric(
+            y_values.str.replace(',', '.', regex=False),
+            errors='raise'
+        )
     
-    return (pd_data_clean, x_label, y_label, title)
+    return pd_data
 
 def create_demo_data():
     """
@@ -135,7 +321,7 @@ def create_demo_data():
             'temperature': [15, 16, 18, 20, 22, 23, 22, 20, 19, 17]}
     return pd.DataFrame(data)
 
-def configure_plot_settings(x_label, y_label, title, data_type):
+def configure_plot_settings(x_label, y_label, title, data_type, ax=None):
     """
     Настройка параметров графика.
     
@@ -149,32 +335,123 @@ def configure_plot_settings(x_label, y_label, title, data_type):
         Заголовок графика
     data_type : str
         Тип данных: 'date' для форматирования дат
+    ax : matplotlib.axes.Axes, optional
+        Оси для настройки. По умолчанию используются текущие оси
     """
-    plt.xlabel(x_label, fontsize=12)
+    # Получаем оси один раз и дальше работаем с ними напрямую
+    if ax is None:
+        ax = plt.gca()
+    
+    ax.set_xlabel(x_label, fontsize=12)
     
     if data_type == 'date':
-        plt.ylabel(f'{y_label} (°C)', fontsize=12)
+        ax.set_ylabel(f'{y_label} (°C)', fontsize=12)
     else:
-        plt.ylabel(y_label, fontsize=12)
+        ax.set_ylabel(y_label, fontsize=12)
     
-    plt.title(title, fontsize=14)
+    ax.set_title(title, fontsize=14)
     
     # Форматируем дату в нужный для построения графика формат
     if data_type == 'date':
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.gca().xaxis.set_major_locator(mdates.AutoDateLocator())
-        plt.xticks(rotation=45)
-    else:
-        plt.xticks()
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(DATE_FORMAT))
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        ax.tick_params(axis='x', labelrotation=45)
     
     # Форматируем ось y для чисел
-    plt.gca().yaxis.set_major_formatter('{x:.2f}')
-    plt.yticks()
+    ax.yaxis.set_major_formatter('{x:.2f}')
     
-    plt.grid(True)
-    plt.legend()
+    ax.grid(True)
+    ax.legend()
 
-def plot_data(pd_data, x_label, y_label, title, data_type):
+def downsample_m4(x, y, n_pixels):
+    """
+    Прореживание ряда алгоритмом M4 перед отрисовкой.
+    
+    Диапазон X делится на n_pixels равных интервалов (по одному на столбец
+    пикселей), в каждом сохраняются первая, последняя, минимальная и
+    максимальная точки. Линия, построенная по ним, визуально совпадает с
+    исходной, но содержит не более 4 * n_pixels точек.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Значения по оси X, упорядоченные по возрастанию (числа или datetime64).
+        Точки с пустым X (NaN, NaT) отбрасываются
+    y : numpy.ndarray
+        Значения по оси Y
+    n_pixels : int
+        Ширина области построения в пикселях
+        
+    Returns
+    -------
+    tuple
+        (x, y) - прореженные массивы. Если X не упорядочен, данные
+        возвращаются без изменений
+    """
+    if np.issubdtype(x.dtype, np.datetime64):
+        finite = ~np.isnat(x)
+        x_num = x.astype('int64')
+    else:
+        x_num = x.astype(float)
+        finite = np.isfinite(x_num)
+    
+    # Точки без значения X (NaN, NaT) не отображаются на линии, а границы
+    # интервалов и проверка порядка должны строиться только по конечным значениям
+    if not finite.all():
+        x_num = x_num[finite]
+    
+    # Алгоритм опирается на упорядоченность по X
+    if len(x_num) == 0 or np.any(np.diff(x_num) < 0):
+        return x, y
+    
+    if len(x_num) != len(x):
+        x, y = x[finite], y[finite]
+    
+    # Номер интервала для каждой точки
+    edges = np.linspace(x_num[0], x_num[-1], n_pixels + 1)
+    buckets = np.clip(np.searchsorted(edges, x_num, side='right') - 1, 0, n_pixels - 1)
+    
+    # Границы непустых интервалов
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(x_num)] - 1
+    counts = ends - starts + 1
+    
+    # Позиции минимума и максимума: первая точка интервала, совпадающая с его экстремумом
+    extremum_indices = []
+    for reduce in (np.fmin.reduceat, np.fmax.reduceat):
+        extremum = np.repeat(reduce(y, starts), counts)
+        positions = np.flatnonzero(y == extremum)
+        if len(positions) == 0:
+            continue
+        found = np.searchsorted(positions, starts)
+        extremum_indices.append(positions[np.minimum(found, len(positions) - 1)])
+    
+    indices = np.unique(np.concatenate([starts, ends] + extremum_indices))
+    return x[indices], y[indices]
+
+def x_values_to_numpy(x_values):
+    """
+    Преобразование значений оси X в массив NumPy для построения графика.
+    
+    Даты с часовым поясом переводятся в UTC без пояса: иначе pandas вернет
+    массив объектов Timestamp вместо datetime64, с которым работают
+    downsample_m4 и mdates.date2num.
+    
+    Parameters
+    ----------
+    x_values : pandas.Series
+        Значения оси X
+        
+    Returns
+    -------
+    numpy.ndarray
+        Непрерывный массив чисел или datetime64
+    """
+    if isinstance(x_values.dtype, pd.DatetimeTZDtype):
+        x_values = x_values.dt.tz_convert(None)
+    return np.ascontiguousarray(x_values.to_numpy())
+
+def plot_data(pd_data, x_label, y_label, title, data_type, ax=None, line=None):
     """
     Построение графика на основе очищенных данных.
     
@@ -190,19 +467,114 @@ def plot_data(pd_data, x_label, y_label, title, data_type):
         Заголовок графика
     data_type : str
         Тип данных: 'date' для форматирования дат, иначе числовой
+    ax : matplotlib.axes.Axes, optional
+        Оси для построения. По умолчанию создается новый график
+    line : matplotlib.lines.Line2D, optional
+        Линия, построенная предыдущим вызовом. Если передана, в ней заменяются
+        только данные, а график заново не создается. Если ax не указан,
+        используются оси этой линии
         
+    Returns
+    -------
+    matplotlib.lines.Line2D
+        Построенная или обновленная линия
+        
+    Examples
+    --------
+    >>> line = plot_data(pd_data, x_label, y_label, title, 'date')
+    >>> # при изменении данных обновляем ту же линию
+    >>> plot_data(new_data, x_label, y_label, title, 'date', line=line)
     """
-    plt.figure(figsize=(10, 6))
+    if ax is None and line is not None:
+        ax = line.axes
     
-    # Строим график
-    plt.plot(
-        pd_data[x_label], 
-        pd_data[y_label], 
-        label=y_label
-    )
+    if ax is None:
+        figure, ax = plt.subplots(figsize=(10, 6))
+    else:
+        figure = ax.figure
+    
+    x = x_values_to_numpy(pd_data[x_label])
+    y = np.ascontiguousarray(pd_data[y_label].to_numpy(dtype=float))
+    
+    # Точек больше, чем можно различить на экране - прореживаем ряд
+    n_pixels = int(figure.get_figwidth() * figure.dpi)
+    if len(pd_data) > 4 * n_pixels:
+        x, y = downsample_m4(x, y, n_pixels)
+    
+    # Даты переводим в числовое представление matplotlib, с ним работает DateFormatter
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = mdates.date2num(x)
+    
+    # Для очень длинных рядов (если прореживание не сократило их) линия
+    # растеризуется один раз, а не хранится векторным путем
+    rasterized = len(x) > 50_000
+    
+    # Повторный вызов: меняем данные существующей линии без пересоздания графика
+    if line is not None:
+        line.set_data(x, y)
+        line.set_rasterized(rasterized)
+        ax.relim()
+        ax.autoscale_view()
+        return line
+    
+    # Строим график, добавляя линию на оси напрямую
+    line = Line2D(x, y, label=y_label, rasterized=rasterized)
+    
+    ax.add_line(line)
+    ax.autoscale_view()
     
     # Настраиваем параметры графика
-    configure_plot_settings(x_label, y_label, title, data_type)
+    configure_plot_settings(x_label, y_label, title, data_type, ax)
+    
+    return line
+
+def plot_data_interactive(pd_data, x_label, y_label, title):
+    """
+    Построение интерактивного графика с динамическим прореживанием.
+    
+    Использует plotly-resampler: в браузер передается только то количество
+    точек, которое помещается в текущую область просмотра, а при
+    масштабировании данные подгружаются заново. Подходит для рядов из
+    миллионов точек.
+    
+    Parameters
+    ----------
+    pd_data : pandas.DataFrame
+        Очищенные данные для построения графика
+    x_label : str
+        Метка для оси X
+    y_label : str
+        Метка для оси Y
+    title : str
+        Заголовок графика
+        
+    Returns
+    -------
+    plotly_resampler.FigureResampler
+        Интерактивный график, отображается вызовом show_dash()
+        
+    Raises
+    ------
+    ImportError
+        Если не установлены plotly и plotly-resampler
+    """
+    import plotly.graph_objects as go
+    from plotly_resampler import FigureResampler
+    
+    # Передаем массивы NumPy, чтобы не преобразовывать Series при каждой перевыборке
+    x = x_values_to_numpy(pd_data[x_label])
+    y = pd_data[y_label].to_numpy(dtype=float)
+    
+    figure = FigureResampler(go.Figure())
+    figure.add_trace(
+        go.Scattergl(name=y_label),
+        hf_x=x,
+        hf_y=y,
+        max_n_samples=2000
+    )
+    figure.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label)
+    
+    return figure
 
 def plot_demo_data():
     """
@@ -218,8 +590,13 @@ def plot_demo_data():
     """
     data_frame = create_demo_data()
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(data_frame['time'], data_frame['temperature'], label='Температура')
+    _, ax = plt.subplots(figsize=(10, 6))
+    ax.add_line(Line2D(
+        data_frame['time'].to_numpy(dtype=float),
+        data_frame['temperature'].to_numpy(dtype=float),
+        label='Температура'
+    ))
+    ax.autoscale_view()
     
     # Настраиваем параметры графика
     configure_plot_settings('Время (часы)', 'Температура (°C)', 'Температура за день', 'num')
@@ -230,6 +607,7 @@ def main():
     
     Обрабатывает аргументы командной строки и запускает соответствующий режим:
     - С файлом данных: построение графика из файла
+    - С файлом данных и флагом --interactive: интерактивный график в браузере
     - Без аргументов: демонстрационный режим
     
     Examples
@@ -242,6 +620,8 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('file_path', type=str, nargs='?')
     parser.add_argument('--data-type', type=str, choices=['date', 'num', 'base'], default='base')
+    parser.add_argument('--date-format', type=str, default=None)
+    parser.add_argument('--interactive', action='store_true')
     args = parser.parse_args()
     
     #Если файл имеет необрабатываемое расширение, вывод ошибки данных
@@ -249,9 +629,22 @@ def main():
         if args.file_path:
 
             # Обработка файла с данными
-            pd_data = read_data_file(args.file_path)
-            pd_data_clean, x_label, y_label, title = parse_data_types(pd_data, args.data_type)
-            plot_data(pd_data_clean, x_label, y_label, title, args.data_type)
+            # Результат преобразования связываем с тем же именем, чтобы не держать
+            # ссылку на сырые данные
+            pd_data, x_label, y_label, title = read_data_file(args.file_path, args.data_type)
+            pd_data = parse_data_types(pd_data, x_label, y_label, args.data_type, args.date_format)
+            
+            if args.interactive:
+                try:
+                    figure = plot_data_interactive(pd_data, x_label, y_label, title)
+                except ImportError as e:
+                    print(f"Для интерактивного режима установите plotly и plotly-resampler: {e}")
+                    return
+                
+                figure.show_dash()
+                return
+            
+            plot_data(pd_data, x_label, y_label, title, args.data_type)
         else:
             # Использование демо-данных
             print("Использование демонстрационных данных")